@@ -5,58 +5,325 @@
 Протокол для работы с инверторами Anern по Modbus RTU/TCP
 """
 
+import asyncio
+import functools
+import inspect
 import logging
+import random
+import socket
+import struct
+import threading
 import time
+import weakref
+from array import array
 from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient
-from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder
-from pymodbus.exceptions import ModbusException
-
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("anern_protocol.log"),
-        logging.StreamHandler()
-    ]
-)
+from pymodbus.exceptions import ModbusException, ModbusIOException, ConnectionException
+
 logger = logging.getLogger("AnernProtocol")
 
 
+def configure_logging(path="anern_protocol.log", level=logging.INFO):
+    """
+    Настройка логирования в файл и консоль
+
+    Библиотека не настраивает логирование при импорте; функция вызывается
+    приложением (например, при запуске модуля как скрипта).
+
+    Args:
+        path (str): Путь к файлу журнала
+        level (int): Уровень логирования
+    """
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(path),
+            logging.StreamHandler()
+        ]
+    )
+
+# Максимальное число регистров в одном запросе Modbus (FC3)
+MAX_REGISTERS_PER_READ = 125
+# Максимальный разрыв между регистрами, при котором чтения объединяются
+MAX_READ_GAP = 8
+
+
+# Форматы struct для типов значений регистров
+DTYPE_FORMATS = {
+    "u16": ">H",
+    "s16": ">h",
+    "u32": ">I",
+    "s32": ">i",
+    "f32": ">f",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _make_decoder(dtype):
+    """
+    Создание функции преобразования значений регистров в число
+
+    Args:
+        dtype (str): Тип значения из DTYPE_FORMATS
+
+    Returns:
+        callable: Функция, принимающая список регистров и возвращающая число
+    """
+    if dtype == "u16":
+        return lambda registers: registers[0]
+
+    value_struct = struct.Struct(DTYPE_FORMATS[dtype])
+    words_struct = struct.Struct(">%dH" % (value_struct.size // 2))
+
+    def decode(registers):
+        return value_struct.unpack(words_struct.pack(*registers))[0]
+
+    return decode
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_keyword(client_class):
+    """
+    Определение имени аргумента с адресом устройства для версии pymodbus
+
+    Args:
+        client_class (type): Класс клиента Modbus
+
+    Returns:
+        str: "slave" для pymodbus 3.x, "unit" для pymodbus 2.x
+    """
+    parameters = inspect.signature(client_class.read_holding_registers).parameters
+    return "slave" if "slave" in parameters else "unit"
+
+
+def _make_encoder(factor):
+    """
+    Создание функции преобразования значения параметра в значение регистра
+
+    Args:
+        factor (float): Множитель регистра
+
+    Returns:
+        callable: Функция, принимающая значение параметра и возвращающая int
+    """
+    if factor == 1:
+        return int
+
+    # Округление вместо усечения: int(47.0 / 0.1) == 469
+    return lambda value: int(round(value / factor))
+
+
+def _build_ranges(register_map, names, max_gap=MAX_READ_GAP, max_count=MAX_REGISTERS_PER_READ):
+    """
+    Группировка параметров в диапазоны смежных регистров для пакетного чтения
+
+    Args:
+        register_map (dict): Карта регистров
+        names (list): Имена параметров из карты регистров
+        max_gap (int): Максимальное число неиспользуемых регистров между параметрами
+        max_count (int): Максимальное число регистров в одном диапазоне
+
+    Returns:
+        list: Список кортежей (start, count, [(name, offset, factor, unit, size, decode), ...], vector),
+            где vector - план векторного преобразования (см. _vector_plan)
+    """
+    entries = sorted(
+        (register_map[name]["address"], name) for name in set(names)
+    )
+
+    ranges = []
+    for address, name in entries:
+        info = register_map[name]
+        size = info["size"]
+        member = (name, 0, info["factor"], info["unit"], size, _make_decoder(info["dtype"]))
+
+        if ranges:
+            start, count, members = ranges[-1][:3]
+            end = address + size
+            if address - (start + count) <= max_gap and end - start <= max_count:
+                members.append((name, address - start) + member[2:])
+                ranges[-1] = (start, max(count, end - start), members)
+                continue
+
+        ranges.append((address, size, [member]))
+
+    return [
+        (start, count, members, _vector_plan(register_map, members))
+        for start, count, members in ranges
+    ]
+
+
+def _vector_plan(register_map, members):
+    """
+    Разделение параметров диапазона на масштабируемые векторно и поэлементно
+
+    Векторно обрабатываются 16-битные параметры с дробным множителем;
+    параметры с множителем 1 и многорегистровые значения обрабатываются поэлементно.
+
+    Args:
+        register_map (dict): Карта регистров
+        members (list): Параметры диапазона в формате _build_ranges
+
+    Returns:
+        tuple: (scalar_members, names, units, offsets, factors, signed)
+    """
+    vector = [
+        member for member in members
+        if member[4] == 1 and member[2] != 1
+        and register_map[member[0]]["dtype"] in ("u16", "s16")
+    ]
+    scalar = [member for member in members if member not in vector]
+
+    return (
+        scalar,
+        tuple(member[0] for member in vector),
+        tuple(member[3] for member in vector),
+        tuple(member[1] for member in vector),
+        tuple(member[2] for member in vector),
+        tuple(register_map[member[0]]["dtype"] == "s16" for member in vector),
+    )
+
+
+_numpy = None
+
+
+def _load_numpy():
+    """
+    Отложенный импорт numpy
+
+    Returns:
+        module: Модуль numpy или None, если numpy не установлен
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+@functools.lru_cache(maxsize=None)
+def _vector_arrays(offsets, factors, signed):
+    """Массивы numpy для векторного преобразования диапазона"""
+    np = _load_numpy()
+    return (
+        np.array(offsets, dtype=np.intp),
+        np.array(factors, dtype=np.float64),
+        np.array(signed, dtype=bool),
+    )
+
+
+def _build_tables(register_map):
+    """
+    Построение параллельных массивов описания регистров
+
+    Args:
+        register_map (dict): Карта регистров
+
+    Returns:
+        tuple: (name_to_idx, addresses, sizes, factors, units, decoders, encoders)
+    """
+    names = list(register_map)
+    return (
+        {name: i for i, name in enumerate(names)},
+        array("H", (register_map[name]["address"] for name in names)),
+        array("B", (register_map[name]["size"] for name in names)),
+        tuple(register_map[name]["factor"] for name in names),
+        tuple(register_map[name]["unit"] for name in names),
+        tuple(_make_decoder(register_map[name]["dtype"]) for name in names),
+        tuple(_make_encoder(register_map[name]["factor"]) for name in names),
+    )
+
+
+def _tune_tcp_socket(sock, user_timeout_ms):
+    """
+    Настройка TCP-сокета: отключение алгоритма Нейгла и
+    быстрое обнаружение разорванного соединения
+
+    Args:
+        sock (socket.socket): Сокет клиента
+        user_timeout_ms (int): Время ожидания подтверждения данных, мс
+    """
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):
+            # Только Linux
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, user_timeout_ms)
+    except (OSError, AttributeError) as e:
+        logger.warning("Failed to configure TCP socket: %s", e)
+
+
+class _TunedTcpClient(ModbusTcpClient):
+    """
+    Клиент Modbus TCP, настраивающий каждый новый сокет
+
+    После неудачной транзакции pymodbus закрывает сокет и открывает новый
+    внутри execute() через connect(), минуя AnernProtocol.connect().
+    """
+
+    user_timeout_ms = 0
+
+    def connect(self):
+        sock = self.socket
+        connected = super().connect()
+        if connected and self.socket is not None and self.socket is not sock:
+            _tune_tcp_socket(self.socket, self.user_timeout_ms)
+        return connected
+
+
+class _RegisterCache(dict):
+    """
+    Кэш прочитанных регистров: (address, count) -> (время чтения, значения)
+
+    Поколение увеличивается при каждом сбросе кэша; чтение, начатое до сброса,
+    не сохраняет в кэш устаревшие значения.
+    """
+
+    __slots__ = ("generation",)
+
+    def __init__(self):
+        super().__init__()
+        self.generation = 0
+
+
 class AnernProtocol:
     """Класс для работы с инверторами Anern по протоколу Modbus RTU/TCP"""
     
     # Карта регистров Anern
+    # ttl - время кэширования значения в секундах (0 - без кэширования)
+    # dtype - тип значения: u16, s16, u32, s32, f32 (старшее слово первым)
     REGISTER_MAP = {
-        "status": {"address": 0x0000, "size": 1, "factor": 1, "unit": ""},
-        "operation_mode": {"address": 0x0001, "size": 1, "factor": 1, "unit": ""},
-        "grid_voltage": {"address": 0x0100, "size": 1, "factor": 0.1, "unit": "V"},
-        "grid_frequency": {"address": 0x0101, "size": 1, "factor": 0.01, "unit": "Hz"},
-        "output_voltage": {"address": 0x0102, "size": 1, "factor": 0.1, "unit": "V"},
-        "output_frequency": {"address": 0x0103, "size": 1, "factor": 0.01, "unit": "Hz"},
-        "output_power": {"address": 0x0104, "size": 1, "factor": 1, "unit": "W"},
-        "output_current": {"address": 0x0105, "size": 1, "factor": 0.1, "unit": "A"},
-        "load_percent": {"address": 0x0106, "size": 1, "factor": 1, "unit": "%"},
-        "bus_voltage": {"address": 0x0110, "size": 1, "factor": 0.1, "unit": "V"},
-        "pv_voltage": {"address": 0x0111, "size": 1, "factor": 0.1, "unit": "V"},
-        "pv_charging_current": {"address": 0x0112, "size": 1, "factor": 0.1, "unit": "A"},
-        "pv_power": {"address": 0x0113, "size": 1, "factor": 1, "unit": "W"},
-        "battery_voltage": {"address": 0x0114, "size": 1, "factor": 0.1, "unit": "V"},
-        "battery_current": {"address": 0x0115, "size": 1, "factor": 0.1, "unit": "A"},
-        "battery_temperature": {"address": 0x0116, "size": 1, "factor": 1, "unit": "°C"},
-        "inverter_temperature": {"address": 0x0117, "size": 1, "factor": 1, "unit": "°C"},
-        "ambient_temperature": {"address": 0x0118, "size": 1, "factor": 1, "unit": "°C"},
-        "battery_soc": {"address": 0x0120, "size": 1, "factor": 1, "unit": "%"},
-        "error_flags_1": {"address": 0x0200, "size": 1, "factor": 1, "unit": ""},
-        "error_flags_2": {"address": 0x0201, "size": 1, "factor": 1, "unit": ""},
-        "max_charging_current": {"address": 0x0300, "size": 1, "factor": 1, "unit": "A"},
-        "max_ac_charging_current": {"address": 0x0301, "size": 1, "factor": 1, "unit": "A"},
-        "max_pv_charging_current": {"address": 0x0302, "size": 1, "factor": 1, "unit": "A"},
-        "charge_source_priority": {"address": 0x0303, "size": 1, "factor": 1, "unit": ""},
-        "output_source_priority": {"address": 0x0304, "size": 1, "factor": 1, "unit": ""},
-        "battery_cutoff_voltage": {"address": 0x0305, "size": 1, "factor": 0.1, "unit": "V"},
-        "battery_reconnect_voltage": {"address": 0x0306, "size": 1, "factor": 0.1, "unit": "V"},
+        "status": {"address": 0x0000, "size": 1, "factor": 1, "unit": "", "ttl": 0.5, "dtype": "u16"},
+        "operation_mode": {"address": 0x0001, "size": 1, "factor": 1, "unit": "", "ttl": 0.5, "dtype": "u16"},
+        "grid_voltage": {"address": 0x0100, "size": 1, "factor": 0.1, "unit": "V", "ttl": 0.5, "dtype": "u16"},
+        "grid_frequency": {"address": 0x0101, "size": 1, "factor": 0.01, "unit": "Hz", "ttl": 0.5, "dtype": "u16"},
+        "output_voltage": {"address": 0x0102, "size": 1, "factor": 0.1, "unit": "V", "ttl": 0.5, "dtype": "u16"},
+        "output_frequency": {"address": 0x0103, "size": 1, "factor": 0.01, "unit": "Hz", "ttl": 0.5, "dtype": "u16"},
+        "output_power": {"address": 0x0104, "size": 1, "factor": 1, "unit": "W", "ttl": 0.5, "dtype": "u16"},
+        "output_current": {"address": 0x0105, "size": 1, "factor": 0.1, "unit": "A", "ttl": 0.5, "dtype": "u16"},
+        "load_percent": {"address": 0x0106, "size": 1, "factor": 1, "unit": "%", "ttl": 0.5, "dtype": "u16"},
+        "bus_voltage": {"address": 0x0110, "size": 1, "factor": 0.1, "unit": "V", "ttl": 0.5, "dtype": "u16"},
+        "pv_voltage": {"address": 0x0111, "size": 1, "factor": 0.1, "unit": "V", "ttl": 0.5, "dtype": "u16"},
+        "pv_charging_current": {"address": 0x0112, "size": 1, "factor": 0.1, "unit": "A", "ttl": 0.5, "dtype": "u16"},
+        "pv_power": {"address": 0x0113, "size": 1, "factor": 1, "unit": "W", "ttl": 0.5, "dtype": "u16"},
+        "battery_voltage": {"address": 0x0114, "size": 1, "factor": 0.1, "unit": "V", "ttl": 0.5, "dtype": "u16"},
+        "battery_current": {"address": 0x0115, "size": 1, "factor": 0.1, "unit": "A", "ttl": 0.5, "dtype": "s16"},
+        "battery_temperature": {"address": 0x0116, "size": 1, "factor": 1, "unit": "°C", "ttl": 0.5, "dtype": "s16"},
+        "inverter_temperature": {"address": 0x0117, "size": 1, "factor": 1, "unit": "°C", "ttl": 0.5, "dtype": "s16"},
+        "ambient_temperature": {"address": 0x0118, "size": 1, "factor": 1, "unit": "°C", "ttl": 0.5, "dtype": "s16"},
+        "battery_soc": {"address": 0x0120, "size": 1, "factor": 1, "unit": "%", "ttl": 0.5, "dtype": "u16"},
+        "error_flags_1": {"address": 0x0200, "size": 1, "factor": 1, "unit": "", "ttl": 0, "dtype": "u16"},
+        "error_flags_2": {"address": 0x0201, "size": 1, "factor": 1, "unit": "", "ttl": 0, "dtype": "u16"},
+        "max_charging_current": {"address": 0x0300, "size": 1, "factor": 1, "unit": "A", "ttl": 30.0, "dtype": "u16"},
+        "max_ac_charging_current": {"address": 0x0301, "size": 1, "factor": 1, "unit": "A", "ttl": 30.0, "dtype": "u16"},
+        "max_pv_charging_current": {"address": 0x0302, "size": 1, "factor": 1, "unit": "A", "ttl": 30.0, "dtype": "u16"},
+        "charge_source_priority": {"address": 0x0303, "size": 1, "factor": 1, "unit": "", "ttl": 30.0, "dtype": "u16"},
+        "output_source_priority": {"address": 0x0304, "size": 1, "factor": 1, "unit": "", "ttl": 30.0, "dtype": "u16"},
+        "battery_cutoff_voltage": {"address": 0x0305, "size": 1, "factor": 0.1, "unit": "V", "ttl": 30.0, "dtype": "u16"},
+        "battery_reconnect_voltage": {"address": 0x0306, "size": 1, "factor": 0.1, "unit": "V", "ttl": 30.0, "dtype": "u16"},
     }
     
     # Режимы работы
@@ -84,7 +351,46 @@ class AnernProtocol:
         "SOLAR_AND_UTILITY": 2,
         "ONLY_SOLAR": 3
     }
-    
+
+    # Основные параметры для статуса
+    STATUS_PARAMETERS = [
+        "operation_mode", "grid_voltage", "output_voltage", "output_power",
+        "pv_voltage", "pv_power", "battery_voltage", "battery_current",
+        "battery_soc", "inverter_temperature"
+    ]
+
+    # Регистры кодов ошибок
+    ERROR_PARAMETERS = ["error_flags_1", "error_flags_2"]
+
+    # Диапазоны регистров для пакетного чтения статуса, кодов ошибок и всей карты регистров
+    _STATUS_RANGES = _build_ranges(REGISTER_MAP, STATUS_PARAMETERS)
+    _ERROR_RANGES = _build_ranges(REGISTER_MAP, ERROR_PARAMETERS)
+    _ALL_RANGES = _build_ranges(REGISTER_MAP, REGISTER_MAP)
+
+    # Кэш построенных диапазонов: набор имен параметров -> диапазоны
+    _ranges_cache = {}
+
+    # Параллельные массивы описания регистров для быстрого доступа по индексу
+    (_NAME_TO_IDX, _ADDR, _SIZE, _FACTOR, _UNIT,
+     _DECODE, _ENCODE) = _build_tables(REGISTER_MAP)
+
+    # Время кэширования по адресам регистров
+    _TTLS = {info["address"]: info["ttl"] for info in REGISTER_MAP.values()}
+
+    # Общие клиенты последовательных портов:
+    # (port, baudrate, parity, stopbits, bytesize) -> [клиент, блокировка, число пользователей]
+    _clients = {}
+    _clients_lock = threading.Lock()
+
+    __slots__ = (
+        "client", "is_connected", "unit_id", "connection_type", "timeout", "retries",
+        "retry_backoff_base", "retry_backoff_cap",
+        "breaker_threshold", "breaker_cooldown", "breaker_cooldown_max",
+        "_port", "_baudrate", "_bytesize", "_parity", "_stopbits", "_host", "_tcp_port",
+        "_cache", "_lock", "_client_key", "_last_errors_nonzero",
+        "_read", "_write", "_write_multi", "_fail_count", "_open_until",
+    )
+
     def __init__(self, config):
         """
         Инициализация адаптера для инвертора Anern
@@ -96,61 +402,230 @@ class AnernProtocol:
                     "port": "/dev/ttyUSB0" | IP адрес,
                     "baudrate": 9600 (для serial),
                     "port": 502 (для tcp),
-                    "unit_id": 1
+                    "unit_id": 1,
+                    "retry_backoff_base": 0.02 (начальная задержка повтора, с),
+                    "retry_backoff_cap": 0.12 (максимальная задержка повтора, с),
+                    "breaker_threshold": 3 (число ошибок подряд до паузы),
+                    "breaker_cooldown": 5.0 (начальная пауза после ошибок, с),
+                    "breaker_cooldown_max": 60.0 (максимальная пауза, с)
                 }
         """
-        self.config = config
         self.client = None
         self.is_connected = False
         self.unit_id = config.get("unit_id", 1)
         self.connection_type = config.get("connection_type", "serial")
         self.timeout = config.get("timeout", 1)
         self.retries = config.get("retries", 3)
-      def connect(self):
+        self.retry_backoff_base = config.get("retry_backoff_base", 0.02)
+        self.retry_backoff_cap = config.get("retry_backoff_cap", 0.12)
+        self.breaker_threshold = config.get("breaker_threshold", 3)
+        self.breaker_cooldown = config.get("breaker_cooldown", 5.0)
+        self.breaker_cooldown_max = config.get("breaker_cooldown_max", 60.0)
+        # Параметры подключения ("port" - устройство для serial и номер порта для tcp)
+        self._port = config.get("port", "/dev/ttyUSB0")
+        self._baudrate = config.get("baudrate", 9600)
+        self._bytesize = config.get("bytesize", 8)
+        self._parity = config.get("parity", 'N')
+        self._stopbits = config.get("stopbits", 1)
+        self._host = config.get("host", "192.168.1.100")
+        self._tcp_port = config.get("port", 502)
+        # Кэш прочитанных регистров: (address, count) -> (время чтения, значения)
+        self._cache = _RegisterCache()
+        # Блокировка доступа к клиенту и ключ общего клиента последовательного порта
+        self._lock = threading.Lock()
+        self._client_key = None
+        # Были ли ненулевые коды ошибок при последнем опросе
+        self._last_errors_nonzero = False
+        # Состояние размыкателя: число ошибок подряд и время окончания паузы
+        self._fail_count = 0
+        self._open_until = 0.0
+        
+    def connect(self):
         """Установка соединения с инвертором"""
         try:
             if self.connection_type.lower() == "serial":
-                # Соединение по Serial/RS485
-                self.client = ModbusSerialClient(
-                    method='rtu',
-                    port=self.config.get("port", "/dev/ttyUSB0"),
-                    baudrate=self.config.get("baudrate", 9600),
-                    bytesize=self.config.get("bytesize", 8),
-                    parity=self.config.get("parity", 'N'),
-                    stopbits=self.config.get("stopbits", 1),
-                    timeout=self.timeout
-                )
+                # Соединение по Serial/RS485 через общий клиент порта
+                self._acquire_serial_client()
             else:
-                # Соединение по Modbus TCP
-                self.client = ModbusTcpClient(
-                    host=self.config.get("host", "192.168.1.100"),
-                    port=self.config.get("port", 502),
+                # Соединение по Modbus TCP; сокет настраивается при каждом подключении
+                self.client = _TunedTcpClient(
+                    host=self._host,
+                    port=self._tcp_port,
                     timeout=self.timeout
                 )
+                self.client.user_timeout_ms = int(self.timeout * self.retries * 1000)
                 
             if self.client.connect():
                 logger.info("Successfully connected to Anern inverter")
+                self._bind_client_methods()
                 self.is_connected = True
                 return True
             else:
                 logger.error("Failed to connect to Anern inverter")
+                self._release_serial_client()
                 self.is_connected = False
                 return False
                 
         except Exception as e:
-            logger.error(f"Error connecting to Anern inverter: {str(e)}")
+            logger.error("Error connecting to Anern inverter: %s", e)
+            self._release_serial_client()
             self.is_connected = False
             return False
+
+    def _bind_client_methods(self):
+        """Привязка методов клиента к адресу устройства для вызовов без kwargs"""
+        unit = {_unit_keyword(type(self.client)): self.unit_id}
+        self._read = functools.partial(self.client.read_holding_registers, **unit)
+        self._write = functools.partial(self.client.write_register, **unit)
+        self._write_multi = functools.partial(self.client.write_registers, **unit)
+
+    def _acquire_serial_client(self):
+        """
+        Получение общего клиента для последовательного порта
+
+        Все экземпляры, работающие с одним портом, используют один клиент
+        и одну блокировку: на шине RS-485 допускается только один активный запрос.
+        """
+        key = (self._port, self._baudrate, self._parity, self._stopbits, self._bytesize)
+
+        with self._clients_lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                client = ModbusSerialClient(
+                    method='rtu',
+                    port=key[0],
+                    baudrate=key[1],
+                    bytesize=key[4],
+                    parity=key[2],
+                    stopbits=key[3],
+                    timeout=self.timeout
+                )
+                entry = [client, threading.Lock(), 0]
+                self._clients[key] = entry
+
+            if self._client_key != key:
+                entry[2] += 1
+                self._client_key = key
+
+        self.client, self._lock = entry[0], entry[1]
+
+    def _release_serial_client(self):
+        """Освобождение общего клиента; порт закрывается последним пользователем"""
+        if self._client_key is None:
+            return
+
+        with self._clients_lock:
+            entry = self._clients.get(self._client_key)
+            if entry is not None:
+                entry[2] -= 1
+                if entry[2] <= 0:
+                    del self._clients[self._client_key]
+                    entry[0].close()
+            self._client_key = None
             
     def disconnect(self):
         """Закрытие соединения с инвертором"""
         if self.client and self.is_connected:
-            self.client.close()
+            if self._client_key is not None:
+                self._release_serial_client()
+            else:
+                self.client.close()
             self.is_connected = False
             logger.info("Disconnected from Anern inverter")
             return True
         return False
         
+    def _range_ttl(self, address, count):
+        """
+        Время кэширования диапазона регистров
+
+        Args:
+            address (int): Адрес первого регистра
+            count (int): Количество регистров
+
+        Returns:
+            float: Минимальное время кэширования параметров диапазона или 0
+        """
+        ttls = [
+            self._TTLS[addr] for addr in range(address, address + count)
+            if addr in self._TTLS
+        ]
+        return min(ttls) if ttls else 0
+
+    def invalidate_cache(self, address=None):
+        """
+        Сброс кэша прочитанных регистров
+
+        Args:
+            address (int): Адрес регистра, диапазоны с которым нужно сбросить.
+                Если не указан, кэш очищается полностью
+        """
+        # Поколение меняется до удаления записей: чтения, начатые раньше,
+        # не сохранят свой результат (см. read_register)
+        self._cache.generation += 1
+
+        if address is None:
+            self._cache.clear()
+            return
+
+        # Кэш общий для соединений пула: ключ мог быть уже удален другим потоком
+        for start, count in list(self._cache):
+            if start <= address < start + count:
+                self._cache.pop((start, count), None)
+
+    def _backoff(self, attempt):
+        """
+        Экспоненциальная задержка со случайной добавкой перед повторной попыткой
+
+        Args:
+            attempt (int): Номер неудачной попытки, начиная с 0
+        """
+        if attempt >= self.retries - 1:
+            return
+
+        base = self.retry_backoff_base
+        delay = min(base * 2 ** attempt, self.retry_backoff_cap) + random.uniform(0, base)
+        time.sleep(delay)
+
+    def _breaker_open(self):
+        """
+        Проверка размыкателя: после серии неудачных запросов новые запросы
+        не отправляются до окончания паузы
+
+        Returns:
+            bool: True если запросы временно не выполняются
+        """
+        return time.monotonic() < self._open_until
+
+    def _record_failure(self):
+        """Учет неудачного запроса и размыкание после breaker_threshold ошибок подряд"""
+        self._fail_count += 1
+        if self._fail_count < self.breaker_threshold:
+            return
+
+        # Пауза удваивается с каждой неудачной попыткой после размыкания
+        cooldown = min(
+            self.breaker_cooldown * 2 ** (self._fail_count - self.breaker_threshold),
+            self.breaker_cooldown_max
+        )
+        self._open_until = time.monotonic() + cooldown
+        logger.warning("Anern inverter unavailable, skipping requests for %.1f s", cooldown)
+
+    def _record_result(self, transport_failed):
+        """
+        Учет неудачного запроса: размыкатель учитывает только ошибки связи
+
+        Ответ устройства с исключением Modbus (например, неверный адрес)
+        означает, что связь есть, и сбрасывает счетчик ошибок.
+
+        Args:
+            transport_failed (bool): Последняя попытка завершилась ошибкой связи
+        """
+        if transport_failed:
+            self._record_failure()
+        else:
+            self._fail_count = 0
+
     def read_register(self, address, count=1):
         """
         Чтение регистра из инвертора
@@ -162,30 +637,51 @@ class AnernProtocol:
         Returns:
             list: Список значений регистров или None в случае ошибки
         """
+        ttl = self._range_ttl(address, count)
+        if ttl > 0:
+            cached = self._cache.get((address, count))
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+        if self._breaker_open():
+            return None
+
         if not self.is_connected and not self.connect():
+            self._record_failure()
             return None
-            
+
+        generation = self._cache.generation
+        transport_failed = False
         for attempt in range(self.retries):
             try:
-                response = self.client.read_holding_registers(
-                    address=address,
-                    count=count,
-                    unit=self.unit_id
-                )
+                with self._lock:
+                    response = self._read(address, count)
                 
                 if response.isError():
-                    logger.error(f"Error reading register {address}: {response}")
+                    logger.error("Error reading register %s: %s", address, response)
+                    # ModbusIOException - нет ответа; иначе устройство ответило исключением
+                    transport_failed = isinstance(response, ModbusIOException)
                     continue
-                    
+
+                self._fail_count = 0
+                if ttl > 0:
+                    key = (address, count)
+                    self._cache[key] = (time.monotonic(), response.registers)
+                    # Кэш сброшен записью во время чтения: значения могли устареть
+                    if self._cache.generation != generation:
+                        self._cache.pop(key, None)
                 return response.registers
                 
             except ModbusException as e:
-                logger.error(f"Modbus error reading register {address}: {str(e)}")
-                time.sleep(0.1)
+                logger.error("Modbus error reading register %s: %s", address, e)
+                transport_failed = isinstance(e, (ModbusIOException, ConnectionException))
+                self._backoff(attempt)
             except Exception as e:
-                logger.error(f"Error reading register {address}: {str(e)}")
-                time.sleep(0.1)
-                
+                logger.error("Error reading register %s: %s", address, e)
+                transport_failed = isinstance(e, OSError)
+                self._backoff(attempt)
+
+        self._record_result(transport_failed)
         return None
         
     def write_register(self, address, value):
@@ -199,32 +695,89 @@ class AnernProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
+        if self._breaker_open():
+            return False
+
         if not self.is_connected and not self.connect():
+            self._record_failure()
             return False
             
+        transport_failed = False
         for attempt in range(self.retries):
             try:
-                response = self.client.write_register(
-                    address=address,
-                    value=value,
-                    unit=self.unit_id
-                )
+                with self._lock:
+                    response = self._write(address, value)
                 
                 if response.isError():
-                    logger.error(f"Error writing register {address}: {response}")
+                    logger.error("Error writing register %s: %s", address, response)
+                    # ModbusIOException - нет ответа; иначе устройство ответило исключением
+                    transport_failed = isinstance(response, ModbusIOException)
                     continue
-                    
+
+                self._fail_count = 0
+                self.invalidate_cache(address)
                 return True
                 
             except ModbusException as e:
-                logger.error(f"Modbus error writing register {address}: {str(e)}")
-                time.sleep(0.1)
+                logger.error("Modbus error writing register %s: %s", address, e)
+                transport_failed = isinstance(e, (ModbusIOException, ConnectionException))
+                self._backoff(attempt)
             except Exception as e:
-                logger.error(f"Error writing register {address}: {str(e)}")
-                time.sleep(0.1)
-                
+                logger.error("Error writing register %s: %s", address, e)
+                transport_failed = isinstance(e, OSError)
+                self._backoff(attempt)
+
+        self._record_result(transport_failed)
+        return False
+
+    def write_registers(self, address, values):
+        """
+        Запись значений в несколько последовательных регистров одним запросом (FC16)
+
+        Args:
+            address (int): Адрес первого регистра
+            values (list): Значения для записи
+
+        Returns:
+            bool: True в случае успеха, False в случае ошибки
+        """
+        if self._breaker_open():
+            return False
+
+        if not self.is_connected and not self.connect():
+            self._record_failure()
+            return False
+
+        transport_failed = False
+        for attempt in range(self.retries):
+            try:
+                with self._lock:
+                    response = self._write_multi(address, values)
+
+                if response.isError():
+                    logger.error("Error writing registers %s: %s", address, response)
+                    # ModbusIOException - нет ответа; иначе устройство ответило исключением
+                    transport_failed = isinstance(response, ModbusIOException)
+                    continue
+
+                self._fail_count = 0
+                for offset in range(len(values)):
+                    self.invalidate_cache(address + offset)
+                return True
+
+            except ModbusException as e:
+                logger.error("Modbus error writing registers %s: %s", address, e)
+                transport_failed = isinstance(e, (ModbusIOException, ConnectionException))
+                self._backoff(attempt)
+            except Exception as e:
+                logger.error("Error writing registers %s: %s", address, e)
+                transport_failed = isinstance(e, OSError)
+                self._backoff(attempt)
+
+        self._record_result(transport_failed)
         return False
-      def read_parameter(self, parameter_name):
+        
+    def read_parameter(self, parameter_name):
         """
         Чтение параметра из инвертора по имени параметра
         
@@ -234,34 +787,158 @@ class AnernProtocol:
         Returns:
             dict: Словарь с значением и единицей измерения или None в случае ошибки
         """
-        if parameter_name not in self.REGISTER_MAP:
-            logger.error(f"Unknown parameter: {parameter_name}")
+        i = self._NAME_TO_IDX.get(parameter_name)
+        if i is None:
+            logger.error("Unknown parameter: %s", parameter_name)
             return None
-            
-        register_info = self.REGISTER_MAP[parameter_name]
-        address = register_info["address"]
-        size = register_info["size"]
-        factor = register_info["factor"]
-        unit = register_info["unit"]
-        
-        registers = self.read_register(address, size)
+
+        registers = self.read_register(self._ADDR[i], self._SIZE[i])
         if registers is None:
             return None
-            
+
+        return self._decode_value(
+            parameter_name, registers, self._DECODE[i], self._FACTOR[i], self._UNIT[i]
+        )
+
+    def _decode_value(self, parameter_name, registers, decode, factor, unit):
+        """
+        Преобразование значений регистров в значение параметра
+
+        Args:
+            parameter_name (str): Имя параметра из REGISTER_MAP
+            registers (list): Значения регистров параметра
+            decode (callable): Функция преобразования регистров в число
+            factor (float): Множитель
+            unit (str): Единица измерения
+
+        Returns:
+            dict: Словарь с значением и единицей измерения или None в случае ошибки
+        """
         try:
-            if size == 1:
-                value = registers[0] * factor
-            elif size == 2:
-                value = (registers[0] << 16 | registers[1]) * factor
-            else:
-                value = registers[0] * factor
-                
-            return {"value": value, "unit": unit}
-            
+            return {"value": decode(registers) * factor, "unit": unit}
+
         except Exception as e:
-            logger.error(f"Error processing parameter {parameter_name}: {str(e)}")
+            logger.error("Error processing parameter %s: %s", parameter_name, e)
             return None
-            
+
+    @classmethod
+    def _get_ranges(cls, names):
+        """
+        Получение диапазонов регистров для набора параметров
+
+        Диапазоны строятся один раз для каждого набора имен и сохраняются
+        в кэше класса.
+
+        Args:
+            names (list): Имена параметров из REGISTER_MAP
+
+        Returns:
+            list: Диапазоны в формате _build_ranges
+        """
+        key = (cls, frozenset(names))
+        ranges = cls._ranges_cache.get(key)
+        if ranges is None:
+            ranges = _build_ranges(cls.REGISTER_MAP, key[1])
+            cls._ranges_cache[key] = ranges
+        return ranges
+
+    def _read_ranges(self, ranges):
+        """
+        Чтение параметров диапазонами смежных регистров
+
+        Args:
+            ranges (list): Диапазоны, построенные _build_ranges
+
+        Returns:
+            dict: Словарь {имя параметра: {"value": ..., "unit": ...}} для успешно прочитанных параметров
+        """
+        registers_list = [self.read_register(start, count) for start, count, _, _ in ranges]
+        return self._decode_ranges(ranges, registers_list)
+
+    def _decode_ranges(self, ranges, registers_list):
+        """
+        Преобразование прочитанных диапазонов регистров в значения параметров
+
+        Args:
+            ranges (list): Диапазоны, построенные _build_ranges
+            registers_list (list): Значения регистров каждого диапазона или None
+
+        Returns:
+            dict: Словарь {имя параметра: {"value": ..., "unit": ...}} для успешно прочитанных параметров
+        """
+        results = {}
+
+        np = _load_numpy()
+
+        for (start, count, members, vector), registers in zip(ranges, registers_list):
+            if registers is None:
+                continue
+
+            if np is not None and vector[1]:
+                scalar, names, units, offsets, factors, signed = vector
+                idx, factor_array, signed_mask = _vector_arrays(offsets, factors, signed)
+
+                try:
+                    raw = np.asarray(registers, dtype=np.uint16)[idx]
+                except IndexError as e:
+                    # Короткий ответ: все параметры диапазона разбираются поэлементно
+                    logger.error("Error processing range %s: %s", start, e)
+                else:
+                    values = np.where(signed_mask, raw.view(np.int16), raw) * factor_array
+                    for name, unit, value in zip(names, units, values.tolist()):
+                        results[name] = {"value": value, "unit": unit}
+
+                    members = scalar
+
+            for name, offset, factor, unit, size, decode in members:
+                result = self._decode_value(
+                    name, registers[offset:offset + size], decode, factor, unit
+                )
+                if result:
+                    results[name] = result
+
+        return results
+
+    def read_parameters(self, parameter_names):
+        """
+        Чтение нескольких параметров с объединением смежных регистров в один запрос
+
+        Args:
+            parameter_names (list): Имена параметров из REGISTER_MAP
+
+        Returns:
+            dict: Словарь {имя параметра: {"value": ..., "unit": ...}} для успешно прочитанных параметров
+        """
+        return self._read_ranges(self._plan_parameters(parameter_names))
+
+    def _plan_parameters(self, parameter_names):
+        """
+        Построение диапазонов чтения для списка параметров
+
+        Args:
+            parameter_names (list): Имена параметров; неизвестные имена пропускаются
+
+        Returns:
+            list: Диапазоны в формате _build_ranges
+        """
+        names = []
+        for name in parameter_names:
+            if name not in self._NAME_TO_IDX:
+                logger.error("Unknown parameter: %s", name)
+                continue
+            names.append(name)
+
+        return self._get_ranges(names)
+
+    def read_all_parameters(self):
+        """
+        Чтение всех параметров из REGISTER_MAP
+
+        Returns:
+            dict: Словарь {имя параметра: {"value": ..., "unit": ...}} для успешно прочитанных параметров
+        """
+        return self._read_ranges(self._ALL_RANGES)
+
     def write_parameter(self, parameter_name, value):
         """
         Запись параметра в инвертор по имени параметра
@@ -273,54 +950,143 @@ class AnernProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
-        if parameter_name not in self.REGISTER_MAP:
-            logger.error(f"Unknown parameter: {parameter_name}")
+        i = self._NAME_TO_IDX.get(parameter_name)
+        if i is None:
+            logger.error("Unknown parameter: %s", parameter_name)
             return False
-            
-        register_info = self.REGISTER_MAP[parameter_name]
-        address = register_info["address"]
-        factor = register_info["factor"]
-        
-        # Преобразование значения с учетом множителя
-        register_value = int(value / factor)
-        
-        return self.write_register(address, register_value)
+
+        return self.write_register(self._ADDR[i], self._ENCODE[i](value))
+
+    def write_parameters(self, values):
+        """
+        Запись нескольких параметров с объединением смежных регистров в один запрос
+
+        Args:
+            values (dict): Словарь {имя параметра из REGISTER_MAP: значение}
+
+        Returns:
+            bool: True если все параметры записаны, False в случае ошибки
+        """
+        entries = []
+        for name, value in values.items():
+            i = self._NAME_TO_IDX.get(name)
+            if i is None:
+                logger.error("Unknown parameter: %s", name)
+                return False
+            entries.append((self._ADDR[i], self._ENCODE[i](value)))
+
+        # Группировка строго последовательных адресов
+        groups = []
+        for address, register_value in sorted(entries):
+            if groups and groups[-1][0] + len(groups[-1][1]) == address:
+                groups[-1][1].append(register_value)
+            else:
+                groups.append((address, [register_value]))
+
+        success = True
+        for address, register_values in groups:
+            if len(register_values) == 1:
+                result = self.write_register(address, register_values[0])
+            else:
+                result = self.write_registers(address, register_values)
+            success = success and result
+
+        return success
+
+    def apply_config(self, **settings):
+        """
+        Применение нескольких настроек инвертора минимальным числом запросов
+
+        Args:
+            **settings: Параметры из REGISTER_MAP и их значения. Для
+                charge_source_priority и output_source_priority допускаются
+                имена из CHARGE_PRIORITIES и OUTPUT_PRIORITIES
+
+        Returns:
+            bool: True если все настройки применены, False в случае ошибки
+        """
+        enums = {
+            "charge_source_priority": self.CHARGE_PRIORITIES,
+            "output_source_priority": self.OUTPUT_PRIORITIES,
+        }
+
+        values = {}
+        for name, value in settings.items():
+            if name in enums and isinstance(value, str):
+                enum_value = enums[name].get(value)
+                if enum_value is None:
+                    logger.error("Unknown value for %s: %s", name, value)
+                    return False
+                value = enum_value
+            values[name] = value
+
+        return self.write_parameters(values)
         
-    def get_status(self):
+    def get_status(self, force_read_errors=False):
         """
         Получение общего статуса инвертора
+
+        Коды ошибок читаются только если инвертор в режиме FAULT_MODE, режим
+        не удалось прочитать или при предыдущем опросе были ошибки.
         
+        Args:
+            force_read_errors (bool): Всегда читать коды ошибок
+
         Returns:
             dict: Словарь с основными параметрами инвертора
         """
-        status = {}
-        
-        # Основные параметры для статуса
-        parameters = [
-            "operation_mode", "grid_voltage", "output_voltage", "output_power",
-            "pv_voltage", "pv_power", "battery_voltage", "battery_current",
-            "battery_soc", "inverter_temperature"
-        ]
-        
-        for param in parameters:
-            result = self.read_parameter(param)
-            if result:
-                status[param] = result
-                
-        # Добавление кодов ошибок, если они есть
-        error_flags_1 = self.read_parameter("error_flags_1")
-        error_flags_2 = self.read_parameter("error_flags_2")
-        
-        if error_flags_1 and error_flags_1["value"] > 0:
-            status["has_errors"] = True
-            status["error_flags_1"] = error_flags_1
-        
-        if error_flags_2 and error_flags_2["value"] > 0:
-            status["has_errors"] = True
-            status["error_flags_2"] = error_flags_2
-            
+        # Чтение параметров статуса диапазонами регистров
+        results = self._read_ranges(self._STATUS_RANGES)
+        status = self._status_from_results(results)
+
+        if force_read_errors or self._needs_error_read(results):
+            self._add_errors(status, self._read_ranges(self._ERROR_RANGES))
+
         return status
-        
+
+    def _status_from_results(self, results):
+        """Отбор параметров статуса из прочитанных значений"""
+        return {param: results[param] for param in self.STATUS_PARAMETERS if param in results}
+
+    def _needs_error_read(self, results):
+        """
+        Проверка необходимости чтения кодов ошибок
+
+        Args:
+            results (dict): Прочитанные параметры статуса
+
+        Returns:
+            bool: True если режим FAULT_MODE, режим неизвестен или при предыдущем опросе были ошибки
+        """
+        operation_mode = results.get("operation_mode")
+        return (
+            self._last_errors_nonzero
+            or operation_mode is None
+            or operation_mode["value"] == self.OPERATION_MODES["FAULT_MODE"]
+        )
+
+    def _add_errors(self, status, errors):
+        """
+        Добавление ненулевых кодов ошибок в статус
+
+        Args:
+            status (dict): Статус инвертора
+            errors (dict): Прочитанные коды ошибок
+        """
+        nonzero = False
+
+        for param in self.ERROR_PARAMETERS:
+            flags = errors.get(param)
+            if flags and flags["value"] > 0:
+                status["has_errors"] = True
+                status[param] = flags
+                nonzero = True
+
+        # Признак ошибок сбрасывается, только если прочитаны все флаги ошибок:
+        # при неудачном чтении регистры ошибок опрашиваются и в следующий раз
+        if nonzero or all(param in errors for param in self.ERROR_PARAMETERS):
+            self._last_errors_nonzero = nonzero
+
     def set_mode(self, mode):
         """
         Установка режима работы инвертора
@@ -331,12 +1097,12 @@ class AnernProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
-        if mode in self.OPERATION_MODES:
-            mode_value = self.OPERATION_MODES[mode]
-            return self.write_parameter("operation_mode", mode_value)
-        else:
-            logger.error(f"Unknown operation mode: {mode}")
+        mode_value = self.OPERATION_MODES.get(mode)
+        if mode_value is None:
+            logger.error("Unknown operation mode: %s", mode)
             return False
+
+        return self.write_parameter("operation_mode", mode_value)
             
     def set_charge_priority(self, priority):
         """
@@ -348,12 +1114,12 @@ class AnernProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
-        if priority in self.CHARGE_PRIORITIES:
-            priority_value = self.CHARGE_PRIORITIES[priority]
-            return self.write_parameter("charge_source_priority", priority_value)
-        else:
-            logger.error(f"Unknown charge priority: {priority}")
+        priority_value = self.CHARGE_PRIORITIES.get(priority)
+        if priority_value is None:
+            logger.error("Unknown charge priority: %s", priority)
             return False
+
+        return self.write_parameter("charge_source_priority", priority_value)
             
     def set_output_priority(self, priority):
         """
@@ -365,12 +1131,12 @@ class AnernProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
-        if priority in self.OUTPUT_PRIORITIES:
-            priority_value = self.OUTPUT_PRIORITIES[priority]
-            return self.write_parameter("output_source_priority", priority_value)
-        else:
-            logger.error(f"Unknown output priority: {priority}")
+        priority_value = self.OUTPUT_PRIORITIES.get(priority)
+        if priority_value is None:
+            logger.error("Unknown output priority: %s", priority)
             return False
+
+        return self.write_parameter("output_source_priority", priority_value)
             
     def set_max_charging_current(self, current):
         """
@@ -396,9 +1162,242 @@ class AnernProtocol:
         """
         return self.write_parameter("battery_cutoff_voltage", voltage)
 
+    # Шаблон метода чтения отдельного параметра
+    _ACCESSOR_TEMPLATE = (
+        "def read_{name}(self):\n"
+        "    \"\"\"Чтение параметра {name} ({address:#06x})\"\"\"\n"
+        "    r = self.read_register({address}, {size})\n"
+        "    if r is None:\n"
+        "        return None\n"
+        "    try:\n"
+        "        return {{\"value\": {value} * {factor!r}, \"unit\": {unit!r}}}\n"
+        "    except Exception as e:\n"
+        "        logger.error(\"Error processing parameter %s: %s\", {name!r}, e)\n"
+        "        return None\n"
+    )
+
+    @classmethod
+    def _install_accessors(cls):
+        """
+        Генерация методов read_<имя параметра> для всех параметров REGISTER_MAP
+
+        Адрес, размер, множитель и единица измерения подставляются в код
+        метода как константы, поэтому при вызове не выполняются поиски по карте регистров.
+        Ошибки разбора ответа обрабатываются так же, как в _decode_value.
+        """
+        for name, info in cls.REGISTER_MAP.items():
+            method_name = "read_" + name
+            if method_name in cls.__dict__:
+                continue
+
+            decoder = _make_decoder(info["dtype"])
+            value = "r[0]" if info["dtype"] == "u16" else "_decode(r)"
+            source = cls._ACCESSOR_TEMPLATE.format(
+                name=name, address=info["address"], size=info["size"],
+                value=value, factor=info["factor"], unit=info["unit"]
+            )
+
+            namespace = {"_decode": decoder, "logger": logger}
+            exec(compile(source, "<AnernProtocol.%s>" % method_name, "exec"), namespace)
+            setattr(cls, method_name, namespace[method_name])
+
+
+AnernProtocol._install_accessors()
+
+
+class AsyncAnernProtocol:
+    """
+    Асинхронный адаптер для инверторов Anern поверх AnernProtocol
+
+    Блокирующий ввод-вывод выполняется в пуле потоков, поэтому несколько
+    инверторов могут опрашиваться одновременно в одном цикле событий.
+    Запросы к инверторам на одном последовательном порту выполняются
+    строго по очереди: на шине RTU допускается только один активный запрос.
+
+    Для Modbus TCP параметр "tcp_concurrency" (по умолчанию 1) задает число
+    соединений с инвертором; при значении больше 1 диапазоны регистров
+    в get_status и read_parameters читаются параллельно по разным соединениям.
+    """
+
+    # Блокировки последовательных портов, общие для всех экземпляров:
+    # цикл событий -> {порт: asyncio.Lock}. asyncio.Lock привязывается к циклу,
+    # в котором его ожидали, поэтому для каждого цикла создаются свои блокировки.
+    _port_locks = weakref.WeakKeyDictionary()
+
+    def __init__(self, config):
+        """
+        Инициализация асинхронного адаптера для инвертора Anern
+
+        Args:
+            config (dict): Словарь с конфигурацией подключения (см. AnernProtocol)
+        """
+        self.protocol = AnernProtocol(config)
+
+        # Дополнительные соединения для параллельного чтения по TCP
+        self._workers = []
+        self._pool = None
+        self._pool_loop = None
+
+        if self.protocol.connection_type.lower() == "serial":
+            self._port = config.get("port", "/dev/ttyUSB0")
+        else:
+            self._port = None
+            for _ in range(config.get("tcp_concurrency", 1) - 1):
+                worker = AnernProtocol(config)
+                # Общий кэш: запись через основное соединение сбрасывает его для всех
+                worker._cache = self.protocol._cache
+                self._workers.append(worker)
+
+    def _port_lock(self, loop):
+        """
+        Блокировка последовательного порта для текущего цикла событий
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Работающий цикл событий
+
+        Returns:
+            asyncio.Lock: Блокировка порта или None для Modbus TCP
+        """
+        if self._port is None:
+            return None
+        locks = self._port_locks.setdefault(loop, {})
+        return locks.setdefault(self._port, asyncio.Lock())
+
+    async def _call(self, method, *args):
+        """Выполнение блокирующего метода AnernProtocol в пуле потоков"""
+        loop = asyncio.get_running_loop()
+        func = functools.partial(method, *args)
+
+        lock = self._port_lock(loop)
+        if lock is None:
+            return await loop.run_in_executor(None, func)
+
+        async with lock:
+            return await loop.run_in_executor(None, func)
+
+    async def _read_ranges(self, ranges):
+        """
+        Чтение диапазонов регистров; по TCP с несколькими соединениями - параллельно
+
+        Args:
+            ranges (list): Диапазоны, построенные _build_ranges
+
+        Returns:
+            dict: Словарь {имя параметра: {"value": ..., "unit": ...}}
+        """
+        if not self._workers:
+            return await self._call(self.protocol._read_ranges, ranges)
+
+        loop = asyncio.get_running_loop()
+        # Очередь соединений, как и блокировки, привязана к циклу событий
+        if self._pool is None or self._pool_loop is not loop:
+            self._pool = asyncio.Queue()
+            self._pool_loop = loop
+            for worker in [self.protocol] + self._workers:
+                self._pool.put_nowait(worker)
+
+        async def read(start, count):
+            worker = await self._pool.get()
+            try:
+                return await loop.run_in_executor(None, worker.read_register, start, count)
+            finally:
+                self._pool.put_nowait(worker)
+
+        registers_list = await asyncio.gather(
+            *(read(start, count) for start, count, _, _ in ranges)
+        )
+        return self.protocol._decode_ranges(ranges, registers_list)
+
+    async def connect(self):
+        """Установка соединения с инвертором"""
+        return await self._call(self.protocol.connect)
+
+    async def disconnect(self):
+        """Закрытие соединения с инвертором"""
+        for worker in self._workers:
+            await self._call(worker.disconnect)
+        return await self._call(self.protocol.disconnect)
+
+    async def read_register(self, address, count=1):
+        """Чтение регистра из инвертора"""
+        return await self._call(self.protocol.read_register, address, count)
+
+    async def write_register(self, address, value):
+        """Запись значения в регистр инвертора"""
+        return await self._call(self.protocol.write_register, address, value)
+
+    async def read_parameter(self, parameter_name):
+        """Чтение параметра из инвертора по имени параметра"""
+        return await self._call(self.protocol.read_parameter, parameter_name)
+
+    async def read_parameters(self, parameter_names):
+        """Чтение нескольких параметров с объединением смежных регистров"""
+        return await self._read_ranges(self.protocol._plan_parameters(parameter_names))
+
+    async def write_parameter(self, parameter_name, value):
+        """Запись параметра в инвертор по имени параметра"""
+        return await self._call(self.protocol.write_parameter, parameter_name, value)
+
+    async def write_parameters(self, values):
+        """Запись нескольких параметров с объединением смежных регистров"""
+        return await self._call(self.protocol.write_parameters, values)
+
+    async def apply_config(self, **settings):
+        """Применение нескольких настроек инвертора"""
+        return await self._call(functools.partial(self.protocol.apply_config, **settings))
+
+    async def get_status(self, force_read_errors=False):
+        """Получение общего статуса инвертора"""
+        if not self._workers:
+            return await self._call(self.protocol.get_status, force_read_errors)
+
+        protocol = self.protocol
+        results = await self._read_ranges(protocol._STATUS_RANGES)
+        status = protocol._status_from_results(results)
+
+        if force_read_errors or protocol._needs_error_read(results):
+            protocol._add_errors(status, await self._read_ranges(protocol._ERROR_RANGES))
+
+        return status
+
+    async def set_mode(self, mode):
+        """Установка режима работы инвертора"""
+        return await self._call(self.protocol.set_mode, mode)
+
+    async def set_charge_priority(self, priority):
+        """Установка приоритета источника заряда"""
+        return await self._call(self.protocol.set_charge_priority, priority)
+
+    async def set_output_priority(self, priority):
+        """Установка приоритета источника выхода"""
+        return await self._call(self.protocol.set_output_priority, priority)
+
+    async def set_max_charging_current(self, current):
+        """Установка максимального тока заряда"""
+        return await self._call(self.protocol.set_max_charging_current, current)
+
+    async def set_battery_cutoff_voltage(self, voltage):
+        """Установка напряжения отсечки батареи"""
+        return await self._call(self.protocol.set_battery_cutoff_voltage, voltage)
+
+
+async def get_status_all(inverters):
+    """
+    Одновременный опрос статуса нескольких инверторов
+
+    Args:
+        inverters (list): Список экземпляров AsyncAnernProtocol
+
+    Returns:
+        list: Статусы инверторов в том же порядке
+    """
+    return await asyncio.gather(*(inverter.get_status() for inverter in inverters))
+
 
 # Пример использования
 if __name__ == "__main__":
+    configure_logging()
+
     # Пример конфигурации для инвертора Anern
     config = {
         "connection_type": "serial",
@@ -5,29 +5,202 @@
 Протокол для работы с инверторами Deye/Dextrom по Modbus RTU/TCP
 """
 
+import asyncio
+import collections
+import functools
 import logging
+import random
+import struct
 import time
+import weakref
+from array import array
 from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient
 from pymodbus.constants import Endian
 from pymodbus.payload import BinaryPayloadDecoder
-from pymodbus.exceptions import ModbusException
-
-# Настройка логирования
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("deye_protocol.log"),
-        logging.StreamHandler()
-    ]
-)
+from pymodbus.exceptions import ModbusException, ConnectionException
+
 logger = logging.getLogger("DeyeProtocol")
+logger.addHandler(logging.NullHandler())
+
+
+def configure_logging(path="deye_protocol.log", level=logging.INFO):
+    """
+    Настройка логирования в файл и консоль
+
+    Библиотека не настраивает логирование при импорте; функция вызывается
+    приложением (например, при запуске модуля как скрипта).
+
+    Args:
+        path (str): Путь к файлу журнала
+        level (int): Уровень логирования
+    """
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(path),
+            logging.StreamHandler()
+        ]
+    )
+
+# Значение параметра с единицей измерения
+Reading = collections.namedtuple("Reading", "value unit")
+
+# Максимальное число регистров в одном запросе Modbus (FC3)
+MAX_REGISTERS_PER_READ = 125
+# Максимальный разрыв между регистрами, при котором чтения объединяются
+MAX_READ_GAP = 8
+
+
+def _scale_den(name, factor):
+    """
+    Целый делитель N для множителя вида 1/N
+
+    Args:
+        name (str): Имя параметра
+        factor (float): Множитель из карты регистров
+
+    Returns:
+        int: Делитель N
+
+    Raises:
+        ValueError: Если множитель не имеет вида 1/N
+    """
+    den = round(1 / factor)
+    if den < 1 or abs(1 / factor - den) > 1e-9:
+        raise ValueError(f"Factor {factor} of parameter {name} is not of the form 1/N")
+    return den
+
+
+def _build_index(register_map):
+    """
+    Построение индекса регистров, отсортированного по адресу
+
+    Множитель вида 1/N хранится целым делителем N: значения с делителем 1
+    остаются целыми, остальные получаются одним делением при создании Reading.
+
+    Args:
+        register_map (dict): Карта регистров
+
+    Returns:
+        tuple: (names, name_to_idx, addresses, sizes, scale_dens, units, ttls) -
+            имена в порядке адресов, обратный индекс и параллельные массивы
+            адресов, размеров, делителей, единиц и TTL кэша
+    """
+    names = tuple(sorted(register_map, key=lambda name: register_map[name]["address"]))
+    infos = [register_map[name] for name in names]
+    return (
+        names,
+        {name: i for i, name in enumerate(names)},
+        array("H", (info["address"] for info in infos)),
+        array("B", (info["size"] for info in infos)),
+        array("H", (_scale_den(name, info["factor"]) for name, info in zip(names, infos))),
+        tuple(info["unit"] for info in infos),
+        array("d", (info.get("ttl", 0) for info in infos)),
+    )
+
+
+def _plan_runs(addrs, sizes, idxs, max_gap=MAX_READ_GAP, max_count=MAX_REGISTERS_PER_READ):
+    """
+    Группировка параметров в последовательности близко расположенных регистров
+
+    Args:
+        addrs (array): Адреса регистров в порядке возрастания
+        sizes (array): Размеры параметров в регистрах
+        idxs (list): Отсортированные индексы параметров
+        max_gap (int): Максимальное число неиспользуемых регистров между параметрами
+        max_count (int): Максимальное число регистров в одном запросе
+
+    Returns:
+        list: Список кортежей (start, count, [idx, ...])
+    """
+    runs = []
+    for i in idxs:
+        address = addrs[i]
+        end = address + sizes[i]
+
+        if runs:
+            start, count, members = runs[-1]
+            if address - (start + count) <= max_gap and end - start <= max_count:
+                members.append(i)
+                runs[-1] = (start, max(count, end - start), members)
+                continue
+
+        runs.append((address, end - address, [i]))
+
+    return runs
+
+
+@functools.lru_cache(maxsize=None)
+def _words_struct(count):
+    """
+    Скомпилированная структура для упаковки регистров в байты (младшим словом вперед)
+
+    Args:
+        count (int): Число регистров
+
+    Returns:
+        struct.Struct: Структура формата "<{count}H"
+    """
+    return struct.Struct(f"<{count}H")
+
+
+_numpy = None
+_scale_kernel = None
+
+
+def _load_numpy():
+    """
+    Отложенный импорт numpy
+
+    Returns:
+        module: Модуль numpy или None, если numpy не установлен
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+def _load_scale_kernel():
+    """
+    Отложенная компиляция ядра масштабирования регистров с помощью numba
+
+    Компиляция выполняется при первом вызове и кэшируется на диске (cache=True).
+
+    Returns:
+        function: Функция _scale(regs, hi, lo, w_hi, w_lo, dens) или None,
+            если numba не установлена
+    """
+    global _scale_kernel
+    if _scale_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _scale_kernel = False
+        else:
+            np = _load_numpy()
+
+            @njit(cache=True)
+            def _scale(regs, hi, lo, w_hi, w_lo, dens):
+                out = np.empty(hi.shape[0], np.float64)
+                for i in range(hi.shape[0]):
+                    out[i] = (regs[hi[i]] * w_hi[i] + regs[lo[i]] * w_lo[i]) / dens[i]
+                return out
+
+            _scale_kernel = _scale
+    return _scale_kernel or None
 
 
 class DeyeModbusProtocol:
     """Класс для работы с инверторами Deye/Dextrom по Modbus RTU/TCP"""
     
     # Карта регистров Deye/Dextrom
+    # ttl - время кэширования значения настройки в секундах (по умолчанию без кэширования)
     REGISTER_MAP = {
         "grid_voltage": {"address": 0x0004, "size": 1, "factor": 0.1, "unit": "V"},
         "grid_current": {"address": 0x0005, "size": 1, "factor": 0.1, "unit": "A"},
@@ -47,33 +220,33 @@ class DeyeModbusProtocol:
         "load_power": {"address": 0x0017, "size": 1, "factor": 1, "unit": "W"},
         "inverter_temperature": {"address": 0x0018, "size": 1, "factor": 1, "unit": "°C"},
         "operation_mode": {"address": 0x0100, "size": 1, "factor": 1, "unit": ""},
-        "charge_source_priority": {"address": 0x0101, "size": 1, "factor": 1, "unit": ""},
-        "output_source_priority": {"address": 0x0102, "size": 1, "factor": 1, "unit": ""},
-        "max_charging_current": {"address": 0x0103, "size": 1, "factor": 1, "unit": "A"},
-        "max_ac_charging_current": {"address": 0x0104, "size": 1, "factor": 1, "unit": "A"},
-        "battery_type": {"address": 0x0105, "size": 1, "factor": 1, "unit": ""},
-        "float_charging_voltage": {"address": 0x0106, "size": 1, "factor": 0.1, "unit": "V"},
-        "bulk_charging_voltage": {"address": 0x0107, "size": 1, "factor": 0.1, "unit": "V"},
-        "battery_cutoff_voltage": {"address": 0x0108, "size": 1, "factor": 0.1, "unit": "V"},
-        "max_parallel_units": {"address": 0x0109, "size": 1, "factor": 1, "unit": ""},
-        "machine_type": {"address": 0x010A, "size": 1, "factor": 1, "unit": ""},
-        "topology": {"address": 0x010B, "size": 1, "factor": 1, "unit": ""},
-        "output_model_setting": {"address": 0x010C, "size": 1, "factor": 1, "unit": ""},
-        "solar_power_priority": {"address": 0x010D, "size": 1, "factor": 1, "unit": ""},
-        "mppt_strings": {"address": 0x010E, "size": 1, "factor": 1, "unit": ""},
-        "machine_model": {"address": 0x010F, "size": 1, "factor": 1, "unit": ""},
-        "ac_input_voltage_range": {"address": 0x0110, "size": 1, "factor": 1, "unit": ""},
-        "output_voltage": {"address": 0x0111, "size": 1, "factor": 0.1, "unit": "V"},
-        "output_frequency": {"address": 0x0112, "size": 1, "factor": 0.1, "unit": "Hz"},
-        "battery_reconnect_voltage": {"address": 0x0113, "size": 1, "factor": 0.1, "unit": "V"},
-        "battery_under_voltage_alarm": {"address": 0x0114, "size": 1, "factor": 0.1, "unit": "V"},
-        "discharge_limit_current": {"address": 0x0115, "size": 1, "factor": 1, "unit": "A"},
-        "battery_equalization_enable": {"address": 0x0116, "size": 1, "factor": 1, "unit": ""},
-        "battery_equalization_voltage": {"address": 0x0117, "size": 1, "factor": 0.1, "unit": "V"},
-        "battery_equalization_time": {"address": 0x0118, "size": 1, "factor": 1, "unit": "min"},
-        "battery_equalization_timeout": {"address": 0x0119, "size": 1, "factor": 1, "unit": "min"},
-        "battery_equalization_interval": {"address": 0x011A, "size": 1, "factor": 1, "unit": "day"},
-        "battery_equalization_boost": {"address": 0x011B, "size": 1, "factor": 1, "unit": ""},
+        "charge_source_priority": {"address": 0x0101, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "output_source_priority": {"address": 0x0102, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "max_charging_current": {"address": 0x0103, "size": 1, "factor": 1, "unit": "A", "ttl": 3600},
+        "max_ac_charging_current": {"address": 0x0104, "size": 1, "factor": 1, "unit": "A", "ttl": 3600},
+        "battery_type": {"address": 0x0105, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "float_charging_voltage": {"address": 0x0106, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "bulk_charging_voltage": {"address": 0x0107, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "battery_cutoff_voltage": {"address": 0x0108, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "max_parallel_units": {"address": 0x0109, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "machine_type": {"address": 0x010A, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "topology": {"address": 0x010B, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "output_model_setting": {"address": 0x010C, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "solar_power_priority": {"address": 0x010D, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "mppt_strings": {"address": 0x010E, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "machine_model": {"address": 0x010F, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "ac_input_voltage_range": {"address": 0x0110, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "output_voltage": {"address": 0x0111, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "output_frequency": {"address": 0x0112, "size": 1, "factor": 0.1, "unit": "Hz", "ttl": 3600},
+        "battery_reconnect_voltage": {"address": 0x0113, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "battery_under_voltage_alarm": {"address": 0x0114, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "discharge_limit_current": {"address": 0x0115, "size": 1, "factor": 1, "unit": "A", "ttl": 3600},
+        "battery_equalization_enable": {"address": 0x0116, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
+        "battery_equalization_voltage": {"address": 0x0117, "size": 1, "factor": 0.1, "unit": "V", "ttl": 3600},
+        "battery_equalization_time": {"address": 0x0118, "size": 1, "factor": 1, "unit": "min", "ttl": 3600},
+        "battery_equalization_timeout": {"address": 0x0119, "size": 1, "factor": 1, "unit": "min", "ttl": 3600},
+        "battery_equalization_interval": {"address": 0x011A, "size": 1, "factor": 1, "unit": "day", "ttl": 3600},
+        "battery_equalization_boost": {"address": 0x011B, "size": 1, "factor": 1, "unit": "", "ttl": 3600},
         "pv_day_energy": {"address": 0x0200, "size": 1, "factor": 0.1, "unit": "kWh"},
         "pv_month_energy": {"address": 0x0201, "size": 1, "factor": 0.1, "unit": "kWh"},
         "pv_year_energy": {"address": 0x0202, "size": 1, "factor": 0.1, "unit": "kWh"},
@@ -89,6 +262,21 @@ class DeyeModbusProtocol:
         "warning_codes": {"address": 0x0304, "size": 4, "factor": 1, "unit": ""},
     }
     
+    # Индекс регистров по адресам (структура массивов): имена, обратный индекс,
+    # адреса, размеры, целые делители множителей, единицы и TTL кэша.
+    # REGISTER_MAP остается источником данных и используется только для справки.
+    (_NAMES, _NAME_TO_IDX, _ADDRS, _SIZES, _SCALE_DENS,
+     _UNITS, _TTLS) = _build_index(REGISTER_MAP)
+
+    # Параметр по адресу регистра, для сброса кэша при записи
+    _ADDR_TO_NAME = {info["address"]: name for name, info in REGISTER_MAP.items()}
+
+    # Параметры, разбираемые только поэлементно
+    SPECIAL_PARAMETERS = ("time_now", "error_codes", "warning_codes")
+
+    # Кэш планов векторного разбора блоков: (start, names) -> план
+    _vector_plans = {}
+
     # Режимы работы
     OPERATION_MODES = {
         "POWER_ON": 0,
@@ -114,6 +302,13 @@ class DeyeModbusProtocol:
         "SOLAR_FIRST": 1,
         "SBU_PRIORITY": 2
     }
+
+    # Атрибуты экземпляра; константы класса остаются общими
+    __slots__ = (
+        "config", "client", "is_connected", "unit_id", "connection_type",
+        "timeout", "retries", "_cache",
+        "_serial_port", "_baudrate", "_bytesize", "_parity", "_stopbits", "_host", "_tcp_port",
+    )
     
     def __init__(self, config):
         """
@@ -123,11 +318,14 @@ class DeyeModbusProtocol:
             config (dict): Словарь с конфигурацией подключения
                 {
                     "connection_type": "serial" | "tcp",
-                    "port": "/dev/ttyUSB0" | IP адрес,
+                    "serial_port": "/dev/ttyUSB0" (для serial),
                     "baudrate": 9600 (для serial),
-                    "port": 502 (для tcp),
+                    "host": IP адрес (для tcp),
+                    "tcp_port": 502 (для tcp),
                     "unit_id": 1
                 }
+                Ключ "port" поддерживается для совместимости: для serial это
+                устройство, для tcp - номер порта.
         """
         self.config = config
         self.client = None
@@ -136,51 +334,110 @@ class DeyeModbusProtocol:
         self.connection_type = config.get("connection_type", "serial")
         self.timeout = config.get("timeout", 1)
         self.retries = config.get("retries", 3)
-      def connect(self):
+        # Параметры подключения разбираются один раз; ошибка в номере TCP-порта
+        # обнаруживается сразу, а не после тайм-аута подключения
+        is_tcp = self.connection_type.lower() != "serial"
+        self._serial_port = config.get("serial_port", config.get("port", "/dev/ttyUSB0"))
+        self._baudrate = config.get("baudrate", 9600)
+        self._bytesize = config.get("bytesize", 8)
+        self._parity = config.get("parity", 'N')
+        self._stopbits = config.get("stopbits", 1)
+        self._host = config.get("host", "192.168.1.100")
+        self._tcp_port = int(config.get("tcp_port", config.get("port", 502) if is_tcp else 502))
+        # Кэш настроек: имя параметра -> (время чтения, значение)
+        self._cache = {}
+        
+    def connect(self):
         """Установка соединения с инвертором"""
+        # Соединение уже открыто: повторный вызов (например, из __enter__) не создает второй клиент
+        if self.client is not None and self.is_connected:
+            return True
+
         try:
             if self.connection_type.lower() == "serial":
                 # Соединение по Serial/RS485
-                self.client = ModbusSerialClient(
+                client = ModbusSerialClient(
                     method='rtu',
-                    port=self.config.get("port", "/dev/ttyUSB0"),
-                    baudrate=self.config.get("baudrate", 9600),
-                    bytesize=self.config.get("bytesize", 8),
-                    parity=self.config.get("parity", 'N'),
-                    stopbits=self.config.get("stopbits", 1),
+                    port=self._serial_port,
+                    baudrate=self._baudrate,
+                    bytesize=self._bytesize,
+                    parity=self._parity,
+                    stopbits=self._stopbits,
                     timeout=self.timeout
                 )
             else:
                 # Соединение по Modbus TCP
-                self.client = ModbusTcpClient(
-                    host=self.config.get("host", "192.168.1.100"),
-                    port=self.config.get("port", 502),
+                client = ModbusTcpClient(
+                    host=self._host,
+                    port=self._tcp_port,
                     timeout=self.timeout
                 )
                 
-            if self.client.connect():
+            if client.connect():
                 logger.info("Successfully connected to Deye inverter")
+                self.client = client
                 self.is_connected = True
                 return True
             else:
+                # Клиент сохраняется только после успешного подключения,
+                # иначе следующий запрос не вызовет connect()
                 logger.error("Failed to connect to Deye inverter")
+                client.close()
                 self.is_connected = False
                 return False
                 
         except Exception as e:
-            logger.error(f"Error connecting to Deye inverter: {str(e)}")
+            logger.error("Error connecting to Deye inverter: %s", e)
             self.is_connected = False
             return False
     
     def disconnect(self):
         """Закрытие соединения с инвертором"""
-        if self.client and self.is_connected:
+        if self.client is not None:
             self.client.close()
+            self.client = None
             self.is_connected = False
             logger.info("Disconnected from Deye inverter")
             return True
         return False
+
+    def __enter__(self):
+        """Открытие соединения на время блока with"""
+        if not self.connect():
+            raise ConnectionException("Failed to connect to Deye inverter")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Закрытие соединения по выходу из блока with"""
+        self.disconnect()
+        return False
+
+    def _reconnect(self):
+        """
+        Повторное подключение после разрыва соединения
+
+        Returns:
+            bool: True если соединение восстановлено
+        """
+        logger.info("Reconnecting to Deye inverter")
+        self.disconnect()
+        return self.connect()
     
+    def _backoff(self, attempt):
+        """
+        Экспоненциальная задержка со случайной добавкой перед повторной попыткой
+
+        После первой неудачи повтор выполняется сразу, далее задержка растет
+        от 20 мс до 100 мс. После последней попытки задержки нет.
+
+        Args:
+            attempt (int): Номер неудачной попытки, начиная с 0
+        """
+        if attempt == 0 or attempt >= self.retries - 1:
+            return
+
+        time.sleep(min(0.1, 0.01 * (1 << attempt)) + random.random() * 0.005)
+
     def read_register(self, address, count=1):
         """
         Чтение регистра из инвертора
@@ -192,9 +449,10 @@ class DeyeModbusProtocol:
         Returns:
             list: Список значений регистров или None в случае ошибки
         """
-        if not self.is_connected and not self.connect():
+        if self.client is None and not self.connect():
             return None
-            
+
+        reconnected = False
         for attempt in range(self.retries):
             try:
                 response = self.client.read_holding_registers(
@@ -202,19 +460,26 @@ class DeyeModbusProtocol:
                     count=count,
                     unit=self.unit_id
                 )
+                # Ответ с ошибкой (ExceptionResponse, ModbusIOException) не имеет поля registers
+                registers = getattr(response, "registers", None)
+                if registers is not None:
+                    return registers
+                logger.error("Error reading register %s: %s", address, response)
+                self._backoff(attempt)
                 
-                if response.isError():
-                    logger.error(f"Error reading register {address}: {response}")
-                    continue
-                    
-                return response.registers
-                
+            except ConnectionException as e:
+                # Соединение разорвано: одно повторное подключение без паузы
+                logger.error("Connection lost reading register %s: %s", address, e)
+                if reconnected or not self._reconnect():
+                    return None
+                reconnected = True
             except ModbusException as e:
-                logger.error(f"Modbus error reading register {address}: {str(e)}")
-                time.sleep(0.1)
-            except Exception as e:
-                logger.error(f"Error reading register {address}: {str(e)}")
-                time.sleep(0.1)
+                logger.error("Modbus error reading register %s: %s", address, e)
+                self._backoff(attempt)
+            except OSError as e:
+                # Ошибки сокета и последовательного порта; ошибки программы не перехватываются
+                logger.error("I/O error reading register %s: %s", address, e)
+                self._backoff(attempt)
                 
         return None
         
@@ -229,9 +494,10 @@ class DeyeModbusProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
-        if not self.is_connected and not self.connect():
+        if self.client is None and not self.connect():
             return False
-            
+
+        reconnected = False
         for attempt in range(self.retries):
             try:
                 response = self.client.write_register(
@@ -239,19 +505,25 @@ class DeyeModbusProtocol:
                     value=value,
                     unit=self.unit_id
                 )
+                # Ответ с ошибкой не имеет поля value
+                if getattr(response, "value", None) is not None:
+                    self._cache.pop(self._ADDR_TO_NAME.get(address), None)
+                    return True
+                logger.error("Error writing register %s: %s", address, response)
+                self._backoff(attempt)
                 
-                if response.isError():
-                    logger.error(f"Error writing register {address}: {response}")
-                    continue
-                    
-                return True
-                
+            except ConnectionException as e:
+                # Соединение разорвано: одно повторное подключение без паузы
+                logger.error("Connection lost writing register %s: %s", address, e)
+                if reconnected or not self._reconnect():
+                    return False
+                reconnected = True
             except ModbusException as e:
-                logger.error(f"Modbus error writing register {address}: {str(e)}")
-                time.sleep(0.1)
-            except Exception as e:
-                logger.error(f"Error writing register {address}: {str(e)}")
-                time.sleep(0.1)
+                logger.error("Modbus error writing register %s: %s", address, e)
+                self._backoff(attempt)
+            except OSError as e:
+                logger.error("I/O error writing register %s: %s", address, e)
+                self._backoff(attempt)
                 
         return False
         
@@ -263,52 +535,193 @@ class DeyeModbusProtocol:
             parameter_name (str): Имя параметра из REGISTER_MAP
             
         Returns:
-            dict: Словарь с значением и единицей измерения или None в случае ошибки
+            Reading: Значение и единица измерения или None в случае ошибки
         """
-        if parameter_name not in self.REGISTER_MAP:
-            logger.error(f"Unknown parameter: {parameter_name}")
+        idx = self._NAME_TO_IDX.get(parameter_name)
+        if idx is None:
+            logger.error("Unknown parameter: %s", parameter_name)
             return None
-            
-        register_info = self.REGISTER_MAP[parameter_name]
-        address = register_info["address"]
-        size = register_info["size"]
-        factor = register_info["factor"]
-        unit = register_info["unit"]
-        
-        registers = self.read_register(address, size)
+
+        ttl = self._TTLS[idx]
+        if ttl:
+            cached = self._cache.get(parameter_name)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+        address = self._ADDRS[idx]
+        registers = self.read_register(address, self._SIZES[idx])
         if registers is None:
             return None
-            
-        try:
-            # Обработка специальных параметров
-            if parameter_name == "time_now":
-                # Формат времени: часы, минуты, секунды
-                hours = registers[0]
-                minutes = registers[1]
-                seconds = registers[2]
-                return {"value": f"{hours:02d}:{minutes:02d}:{seconds:02d}", "unit": ""}
-                
-            elif parameter_name == "error_codes" or parameter_name == "warning_codes":
-                # Коды ошибок и предупреждений хранятся как битовые маски
-                value = 0
-                for i, reg in enumerate(registers):
-                    value |= reg << (i * 16)
-                return {"value": value, "unit": unit}
-                
-            # Стандартные числовые параметры
-            if size == 1:
-                value = registers[0] * factor
-            elif size == 2:
-                value = (registers[0] << 16 | registers[1]) * factor
+
+        result = self._parse_block(address, registers, [parameter_name]).get(parameter_name)
+        if ttl and result is not None:
+            self._cache[parameter_name] = (time.monotonic(), result)
+        return result
+
+    def read_parameters(self, names):
+        """
+        Чтение нескольких параметров с объединением близких регистров в блоки
+
+        Args:
+            names (list): Имена параметров из REGISTER_MAP
+
+        Returns:
+            dict: Словарь {имя параметра: Reading} для успешно прочитанных параметров
+        """
+        results = {}
+        idxs = set()
+        now = time.monotonic()
+        for name in names:
+            idx = self._NAME_TO_IDX.get(name)
+            if idx is None:
+                logger.error("Unknown parameter: %s", name)
+                continue
+            ttl = self._TTLS[idx]
+            if ttl:
+                cached = self._cache.get(name)
+                if cached and now - cached[0] < ttl:
+                    results[name] = cached[1]
+                    continue
+            idxs.add(idx)
+
+        for start, count, members in _plan_runs(self._ADDRS, self._SIZES, sorted(idxs)):
+            registers = self.read_register(start, count)
+            if registers is None:
+                continue
+            block = self._parse_block(start, registers, [self._NAMES[i] for i in members])
+            now = time.monotonic()
+            for i in members:
+                name = self._NAMES[i]
+                if name in block and self._TTLS[i]:
+                    self._cache[name] = (now, block[name])
+            results.update(block)
+
+        return results
+
+    def _parse_block(self, start, registers, names):
+        """
+        Разбор блока последовательных регистров на значения параметров
+
+        Args:
+            start (int): Адрес первого регистра блока
+            registers (list): Значения регистров блока
+            names (list): Имена параметров, входящих в блок
+
+        Returns:
+            dict: Словарь {имя параметра: Reading} для успешно разобранных параметров
+        """
+        results = {}
+
+        np = _load_numpy()
+        if np is not None:
+            scalar_names, vector_names, vector_units, arrays = self._vector_plan(start, tuple(names))
+            if vector_names:
+                hi, lo, w_hi, w_lo, dens = arrays
+                try:
+                    regs = np.asarray(registers, dtype=np.float64)
+                    scale = _load_scale_kernel()
+                    if scale is not None:
+                        # numba не проверяет границы массивов; смещения упорядочены по адресу
+                        if lo[-1] >= len(regs):
+                            raise IndexError("block too short for parameter offsets")
+                        values = scale(regs, hi, lo, w_hi, w_lo, dens)
+                    else:
+                        values = (regs[hi] * w_hi + regs[lo] * w_lo) / dens
+                    for name, unit, value in zip(vector_names, vector_units, values.tolist()):
+                        results[name] = Reading(value, unit)
+                    names = scalar_names
+                except IndexError as e:
+                    logger.error("Error processing block %s: %s", start, e)
+
+        for parameter_name in names:
+            idx = self._NAME_TO_IDX[parameter_name]
+            offset = self._ADDRS[idx] - start
+            size = self._SIZES[idx]
+            den = self._SCALE_DENS[idx]
+            unit = self._UNITS[idx]
+            values = registers[offset:offset + size]
+
+            try:
+                # Обработка специальных параметров
+                if parameter_name == "time_now":
+                    # Формат времени: часы, минуты, секунды
+                    hours = values[0]
+                    minutes = values[1]
+                    seconds = values[2]
+                    results[parameter_name] = Reading(f"{hours:02d}:{minutes:02d}:{seconds:02d}", "")
+                    continue
+
+                elif parameter_name == "error_codes" or parameter_name == "warning_codes":
+                    # Коды ошибок и предупреждений хранятся как битовые маски,
+                    # первый регистр - младшие 16 бит
+                    packed = _words_struct(len(values)).pack(*values)
+                    value = int.from_bytes(packed, "little")
+                    results[parameter_name] = Reading(value, unit)
+                    continue
+
+                # Стандартные числовые параметры: целое значение регистров,
+                # деление только для дробных множителей
+                if size == 2:
+                    value = values[0] << 16 | values[1]
+                else:
+                    value = values[0]
+                if den != 1:
+                    value /= den
+
+                results[parameter_name] = Reading(value, unit)
+
+            except Exception as e:
+                logger.error("Error processing parameter %s: %s", parameter_name, e)
+
+        return results
+
+    @classmethod
+    def _vector_plan(cls, start, names):
+        """
+        План векторного разбора блока регистров с помощью numpy
+
+        Векторно разбираются 1- и 2-регистровые параметры с дробным множителем;
+        специальные параметры и параметры с множителем 1 разбираются поэлементно.
+
+        Args:
+            start (int): Адрес первого регистра блока
+            names (tuple): Имена параметров, входящих в блок
+
+        Returns:
+            tuple: (scalar_names, vector_names, vector_units, (hi, lo, w_hi, w_lo, dens))
+        """
+        key = (start, names)
+        plan = cls._vector_plans.get(key)
+        if plan is not None:
+            return plan
+
+        np = _load_numpy()
+        scalar_names, vector = [], []
+        for name in names:
+            idx = cls._NAME_TO_IDX[name]
+            if name in cls.SPECIAL_PARAMETERS or cls._SCALE_DENS[idx] == 1 or cls._SIZES[idx] > 2:
+                scalar_names.append(name)
             else:
-                value = registers[0] * factor
-                
-            return {"value": value, "unit": unit}
-            
-        except Exception as e:
-            logger.error(f"Error processing parameter {parameter_name}: {str(e)}")
-            return None
-            
+                vector.append((name, idx))
+
+        # Значение = (старший регистр * w_hi + младший регистр * w_lo) / den
+        offsets = [cls._ADDRS[idx] - start for _, idx in vector]
+        pairs = [cls._SIZES[idx] == 2 for _, idx in vector]
+        plan = (
+            scalar_names,
+            tuple(name for name, _ in vector),
+            tuple(cls._UNITS[idx] for _, idx in vector),
+            (
+                np.array(offsets, dtype=np.intp),
+                np.array([o + 1 if p else o for o, p in zip(offsets, pairs)], dtype=np.intp),
+                np.array([65536.0 if p else 1.0 for p in pairs]),
+                np.array([1.0 if p else 0.0 for p in pairs]),
+                np.array([cls._SCALE_DENS[idx] for _, idx in vector], dtype=np.float64),
+            ),
+        )
+        cls._vector_plans[key] = plan
+        return plan
+
     def write_parameter(self, parameter_name, value):
         """
         Запись параметра в инвертор по имени параметра
@@ -320,28 +733,24 @@ class DeyeModbusProtocol:
         Returns:
             bool: True в случае успеха, False в случае ошибки
         """
-        if parameter_name not in self.REGISTER_MAP:
-            logger.error(f"Unknown parameter: {parameter_name}")
+        idx = self._NAME_TO_IDX.get(parameter_name)
+        if idx is None:
+            logger.error("Unknown parameter: %s", parameter_name)
             return False
-            
-        register_info = self.REGISTER_MAP[parameter_name]
-        address = register_info["address"]
-        factor = register_info["factor"]
-        
-        # Преобразование значения с учетом множителя
-        register_value = int(value / factor)
-        
-        return self.write_register(address, register_value)
+
+        # Преобразование значения с учетом делителя; округление вместо
+        # усечения, иначе int(0.7 / 0.1) == 6
+        register_value = int(round(value * self._SCALE_DENS[idx]))
+
+        return self.write_register(self._ADDRS[idx], register_value)
         
     def get_status(self):
         """
         Получение общего статуса инвертора
         
         Returns:
-            dict: Словарь с основными параметрами инвертора
+            dict: Словарь {имя параметра: Reading} с основными параметрами инвертора
         """
-        status = {}
-        
         # Основные параметры для статуса
         parameters = [
             "grid_voltage", "grid_power", 
@@ -351,20 +760,19 @@ class DeyeModbusProtocol:
             "load_voltage", "load_power", 
             "inverter_temperature", "operation_mode"
         ]
-        
-        for param in parameters:
-            result = self.read_parameter(param)
-            if result:
-                status[param] = result
+
+        # Чтение параметров статуса, ошибок и предупреждений блоками регистров
+        results = self.read_parameters(parameters + ["error_codes", "warning_codes"])
+        status = {param: results[param] for param in parameters if param in results}
         
         # Добавление ошибок и предупреждений, если они есть
-        error_codes = self.read_parameter("error_codes")
-        warning_codes = self.read_parameter("warning_codes")
+        error_codes = results.get("error_codes")
+        warning_codes = results.get("warning_codes")
         
-        if error_codes and error_codes["value"] > 0:
+        if error_codes and error_codes.value > 0:
             status["errors"] = error_codes
             
-        if warning_codes and warning_codes["value"] > 0:
+        if warning_codes and warning_codes.value > 0:
             status["warnings"] = warning_codes
         
         return status
@@ -383,7 +791,7 @@ class DeyeModbusProtocol:
             mode_value = self.OPERATION_MODES[mode]
             return self.write_parameter("operation_mode", mode_value)
         else:
-            logger.error(f"Unknown operation mode: {mode}")
+            logger.error("Unknown operation mode: %s", mode)
             return False
     
     def set_charge_priority(self, priority):
@@ -400,7 +808,7 @@ class DeyeModbusProtocol:
             priority_value = self.CHARGE_PRIORITIES[priority]
             return self.write_parameter("charge_source_priority", priority_value)
         else:
-            logger.error(f"Unknown charge priority: {priority}")
+            logger.error("Unknown charge priority: %s", priority)
             return False
     
     def set_output_priority(self, priority):
@@ -417,7 +825,7 @@ class DeyeModbusProtocol:
             priority_value = self.OUTPUT_PRIORITIES[priority]
             return self.write_parameter("output_source_priority", priority_value)
         else:
-            logger.error(f"Unknown output priority: {priority}")
+            logger.error("Unknown output priority: %s", priority)
             return False
             
     def set_max_charging_current(self, current):
@@ -445,8 +853,148 @@ class DeyeModbusProtocol:
         return self.write_parameter("battery_cutoff_voltage", voltage)
 
 
+class AsyncDeyeModbusProtocol:
+    """
+    Асинхронный адаптер для инверторов Deye/Dextrom поверх DeyeModbusProtocol
+
+    Блокирующий ввод-вывод выполняется в пуле потоков, поэтому несколько
+    инверторов могут опрашиваться одновременно в одном цикле событий
+    (опрос N инверторов занимает max(T_i), а не sum(T_i)). Запросы к
+    инверторам на одном последовательном порту выполняются строго по очереди;
+    запросы к одному инвертору по TCP также не выполняются одновременно,
+    так как синхронный клиент pymodbus не потокобезопасен.
+    """
+
+    # Блокировки последовательных портов, общие для всех экземпляров:
+    # цикл событий -> {порт: asyncio.Lock}. asyncio.Lock привязывается к циклу,
+    # в котором его ожидали, поэтому для каждого цикла создаются свои блокировки.
+    _port_locks = weakref.WeakKeyDictionary()
+
+    def __init__(self, config):
+        """
+        Инициализация асинхронного адаптера для инвертора Deye/Dextrom
+
+        Args:
+            config (dict): Словарь с конфигурацией подключения (см. DeyeModbusProtocol)
+        """
+        self.protocol = DeyeModbusProtocol(config)
+
+        if self.protocol.connection_type.lower() == "serial":
+            self._port = self.protocol._serial_port
+        else:
+            self._port = None
+        # Блокировки соединения TCP этого экземпляра: цикл событий -> asyncio.Lock
+        self._tcp_locks = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self):
+        """Открытие соединения на время блока async with"""
+        await self._call(self.protocol.__enter__)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Закрытие соединения по выходу из блока async with"""
+        await self.disconnect()
+        return False
+
+    def _client_lock(self, loop):
+        """
+        Блокировка клиента для текущего цикла событий
+
+        Для serial блокировка общая для всех инверторов на порту,
+        для TCP - своя у каждого экземпляра.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Работающий цикл событий
+
+        Returns:
+            asyncio.Lock: Блокировка клиента
+        """
+        if self._port is None:
+            lock = self._tcp_locks.get(loop)
+            if lock is None:
+                lock = self._tcp_locks[loop] = asyncio.Lock()
+            return lock
+        locks = self._port_locks.setdefault(loop, {})
+        return locks.setdefault(self._port, asyncio.Lock())
+
+    async def _call(self, method, *args):
+        """Выполнение блокирующего метода DeyeModbusProtocol в пуле потоков"""
+        loop = asyncio.get_running_loop()
+        func = functools.partial(method, *args)
+
+        async with self._client_lock(loop):
+            return await loop.run_in_executor(None, func)
+
+    async def connect(self):
+        """Установка соединения с инвертором"""
+        return await self._call(self.protocol.connect)
+
+    async def disconnect(self):
+        """Закрытие соединения с инвертором"""
+        return await self._call(self.protocol.disconnect)
+
+    async def read_register(self, address, count=1):
+        """Чтение регистра из инвертора"""
+        return await self._call(self.protocol.read_register, address, count)
+
+    async def write_register(self, address, value):
+        """Запись значения в регистр инвертора"""
+        return await self._call(self.protocol.write_register, address, value)
+
+    async def read_parameter(self, parameter_name):
+        """Чтение параметра из инвертора по имени параметра"""
+        return await self._call(self.protocol.read_parameter, parameter_name)
+
+    async def read_parameters(self, names):
+        """Чтение нескольких параметров блоками регистров"""
+        return await self._call(self.protocol.read_parameters, names)
+
+    async def write_parameter(self, parameter_name, value):
+        """Запись параметра в инвертор по имени параметра"""
+        return await self._call(self.protocol.write_parameter, parameter_name, value)
+
+    async def get_status(self):
+        """Получение общего статуса инвертора"""
+        return await self._call(self.protocol.get_status)
+
+    async def set_mode(self, mode):
+        """Установка режима работы инвертора"""
+        return await self._call(self.protocol.set_mode, mode)
+
+    async def set_charge_priority(self, priority):
+        """Установка приоритета источника заряда"""
+        return await self._call(self.protocol.set_charge_priority, priority)
+
+    async def set_output_priority(self, priority):
+        """Установка приоритета источника выхода"""
+        return await self._call(self.protocol.set_output_priority, priority)
+
+    async def set_max_charging_current(self, current):
+        """Установка максимального тока заряда"""
+        return await self._call(self.protocol.set_max_charging_current, current)
+
+    async def set_battery_cutoff_voltage(self, voltage):
+        """Установка напряжения отсечки батареи"""
+        return await self._call(self.protocol.set_battery_cutoff_voltage, voltage)
+
+
+async def get_status_all(inverters):
+    """
+    Одновременный опрос статуса нескольких инверторов
+
+    Args:
+        inverters (list): Список экземпляров AsyncDeyeModbusProtocol
+
+    Returns:
+        list: Статусы инверторов в том же порядке
+    """
+    return await asyncio.gather(*(inverter.get_status() for inverter in inverters))
+
+
 # Пример использования
 if __name__ == "__main__":
+    configure_logging()
+
     # Пример конфигурации для инвертора Deye/Dextrom
     config = {
         "connection_type": "serial",